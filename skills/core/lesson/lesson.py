@@ -23,6 +23,7 @@ PATTERN_RE = re.compile(
     r"WHEN\s+\[?(.+?)\]?\s*->\s*DO\s*(NOT)?\s*\[?(.+?)\]?\s*->\s*BECAUSE\s+\[?(.+?)\]?$",
     re.IGNORECASE
 )
+LESSONS_SECTION_RE = re.compile(r"^[ \t]*## Lessons[ \t]*$", re.MULTILINE)
 
 
 def ensure_storage():
@@ -94,13 +95,16 @@ def get_all_lessons() -> list:
     ensure_storage()
     lessons = {}
     if LESSONS_FILE.exists():
-        for line in LESSONS_FILE.read_text().strip().split("\n"):
-            if line:
-                try:
-                    lesson = json.loads(line)
-                    lessons[lesson["id"]] = lesson
-                except json.JSONDecodeError:
-                    continue
+        # Stream line by line instead of materializing the whole log
+        with open(LESSONS_FILE) as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        lesson = json.loads(line)
+                        lessons[lesson["id"]] = lesson
+                    except json.JSONDecodeError:
+                        continue
     return list(lessons.values())
 
 
@@ -243,24 +247,22 @@ def cmd_promote(lesson_id: str, to_skill: str):
     content = skill_md.read_text()
 
     # Find or create Lessons section
-    if "## Lessons" in content:
-        # Append to existing section
-        lines = content.split("\n")
-        for i, line in enumerate(lines):
-            if line.strip() == "## Lessons":
-                # Find end of section (next ## or end of file)
-                j = i + 1
-                while j < len(lines) and not lines[j].startswith("## "):
-                    j += 1
-                # Insert before next section
-                lines.insert(j, lesson_line)
-                content = "\n".join(lines)
-                break
+    section = LESSONS_SECTION_RE.search(content)
+    if section:
+        # Find end of section (next ## or end of file)
+        end = content.find("\n## ", section.end())
+        if end == -1:
+            # Lessons is the last section: append only the new line
+            with open(skill_md, "a") as f:
+                f.write(f"\n{lesson_line}")
+        else:
+            # Insert before next section
+            content = f"{content[:end + 1]}{lesson_line}\n{content[end + 1:]}"
+            skill_md.write_text(content)
     else:
         # Add new section at end
         content = content.rstrip() + f"\n\n## Lessons\n\n{lesson_line}\n"
-
-    skill_md.write_text(content)
+        skill_md.write_text(content)
 
     # Update index
     index = load_index()